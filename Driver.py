@@ -1,6 +1,8 @@
 from NovelScraper import NovelScraper
 
-scraper = NovelScraper("Martial Peak",batch_size=5700)
-scraper.create_epub()
+# The guard keeps spawned cleaning processes from re-running the scraper.
+if __name__ == "__main__":
+    scraper = NovelScraper("Martial Peak",batch_size=5700)
+    scraper.create_epub()
 
 #https://libread.org/libread/the-legendary-mechanic-37717/chapter-1  ---> Sample URL
@@ -1,3 +1,4 @@
+import io
 import os
 import re
 import time
@@ -7,9 +8,128 @@ from typing import *
 from fake_useragent import UserAgent
 from ebooklib.epub import *
 from bs4 import BeautifulSoup as soup
+from lxml import etree
+from lxml import html as lxml_html
 import unicodedata
 import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+EXCLUSIONS = [
+    "Translator:",
+    "Atlas Studios",
+    "Editor:",
+    "EndlessFantasy Translation"
+]
+LIBREAD_DOMAIN = "libread.com"
+CHAPTER_NOT_AVAILABLE = ' <p> Chapter not available </p>'
+
+# Kept as separate passes: a combined alternation loses the literal-prefix
+# scan the exclusion pattern gets on its own and is slower overall.
+_LIBREAD_LINE_RE = re.compile(
+    r'(?im)^[^\n]*' + re.escape(LIBREAD_DOMAIN) + r'[^\n]*\n?')
+_EXCLUSIONS_RE = re.compile('|'.join(map(re.escape, EXCLUSIONS)))
+_LAST_P_RE = re.compile(
+    r'<p\b[^>]*>(?:(?!</p>).)*</p>\s*(?=(?:[^<]|<(?!p\b))*\Z)', re.DOTALL | re.IGNORECASE)
+_LAST_P_XPATH = etree.XPath("(.//p)[last()]")
+
+# Cleaners
+# These are module level so they can be pickled for the cleaning process pool.
+
+
+def remove_last_p_tag(data):
+    last_p = _LAST_P_XPATH(data)
+    if last_p:
+        last_p[0].drop_tree()
+    return data
+
+
+def remove_libread_lines(data):
+    # Serialized lxml markup keeps inline elements on one line, so the
+    # watermark has to go from the text nodes themselves; dropping the
+    # serialized line would take neighbouring paragraphs with it.
+    # Text is NFKC-normalized first, as the whole chapter is afterwards, so
+    # fullwidth spellings of the domain are caught too.
+    for element in data.iter():
+        if element.text:
+            text = unicodedata.normalize('NFKC', element.text)
+            if LIBREAD_DOMAIN in text.lower():
+                element.text = _LIBREAD_LINE_RE.sub('', text)
+        if element is not data and element.tail:
+            tail = unicodedata.normalize('NFKC', element.tail)
+            if LIBREAD_DOMAIN in tail.lower():
+                element.tail = _LIBREAD_LINE_RE.sub('', tail)
+    return data
+
+
+def clean_text(data):
+    # lxml elements are trimmed before serializing, which saves
+    # re-parsing the HTML just to drop the last paragraph.
+    from_tree = not isinstance(data, str)
+    if from_tree:
+        data = remove_last_p_tag(data)
+        data = remove_libread_lines(data)
+        data = etree.tostring(
+            data, method='html', pretty_print=True, encoding='unicode', with_tail=False)
+    data = unicodedata.normalize('NFKC', data)
+    # lxml elements have already lost the watermark and the last <p>.
+    if not from_tree:
+        data = _LIBREAD_LINE_RE.sub('', data)
+    data = _EXCLUSIONS_RE.sub('', data)
+    if not from_tree:
+        data = _LAST_P_RE.sub('', data, count=1)
+    return data
+
+
+def write_chapter_file(file_path: str, content: str) -> None:
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+
+def _clean_text_static(html: Union[bytes, str], heading: str, file_path: str) -> Optional[str]:
+    # A chapter that fails to clean is staged as unavailable and the error is
+    # returned as text: lxml exceptions cannot be pickled back to the parent,
+    # and raising would only surface once the whole batch is scraped.
+    try:
+        # Serialized lxml elements arrive as bytes, BeautifulSoup output as str.
+        if isinstance(html, bytes):
+            html = next((fragment for fragment in lxml_html.fragments_fromstring(html)
+                         if not isinstance(fragment, str)), None)
+            if html is None:
+                raise ValueError("no element in chapter HTML")
+        content = clean_text(html)
+    except Exception as e:
+        write_chapter_file(file_path, heading + CHAPTER_NOT_AVAILABLE)
+        return f"Failed to clean {file_path}: {e!r}"
+
+    write_chapter_file(file_path, heading + content)
+    return None
+
+
+class StagedEpubHtml(EpubHtml):
+    """
+    An EpubHtml whose content lives in a staged file and is only read when the EPUB is written.
+    """
+
+    def __init__(self, staged_path: str, **kwargs) -> None:
+        self.staged_path = staged_path
+        super().__init__(**kwargs)
+
+    @property
+    def content(self):
+        with open(self.staged_path, 'r', encoding='utf-8') as file:
+            return file.read()
+
+    @content.setter
+    def content(self, value):
+        if value is not None:
+            write_chapter_file(self.staged_path, value)
 
 
 class NovelScraper:
@@ -23,9 +143,14 @@ class NovelScraper:
         LOG_FORMAT (str): The log message format.
         LOG_DATEFMT (str): The log date format.
         EPUB_DIR (str): The directory for storing EPUB files.
+        STAGING_DIR (str): The directory, inside the novel's folder, where chapters are written while scraping.
+        POOL_SIZE (int): The number of pooled connections kept per host.
+        MAX_CLEANER_WORKERS (int): The maximum number of processes used to clean chapters.
+        TAIL_CHUNK_SIZE (int): The number of bytes read at a time when looking for the last line of a file.
+        BACKOFF_FACTOR (float): The base delay in seconds between retries of a chapter.
 
     Methods:
-        __init__(self, novel_name: str, batch_size: int = None) -> None:
+        __init__(self, novel_name: str, batch_size: int = None, parser: str = "lxml") -> None:
             Initializes a NovelScraper instance.
         config_ebook_path(self, initial: int, end: int) -> None:
             Configures the output file path for the EPUB.
@@ -33,29 +158,39 @@ class NovelScraper:
             Prompts the user for an integer input.
         get_novel_name(self) -> str:
             Prompts the user for the name of the novel.
+        read_last_line(self, file_path: str) -> str:
+            Reads the last non-empty line of a file without reading the whole file.
         write_to_file(self, value: str) -> None:
             Writes a value to a file.
         get_url(self) -> str:
             Retrieves the URL for the next chapter to scrape.
-        remove_pattern(self, data, match_string) -> str:
-            Removes lines containing a specific pattern from a string.
-        remove_exclusions(self, data, exclusions) -> str:
-            Removes specified strings from a string.
-        remove_last_p_tag(self, data) -> str:
-            Removes the last <p> tag from an HTML string.
-        clean_text(self, data) -> str:
-            Cleans the text by removing unwanted patterns and tags.
-        find_next_chapter_link(self, page_soup) -> str:
-            Finds the URL of the next chapter in the given HTML soup.
+        submit_clean_text(self, data, heading: str, file_path: str) -> Future:
+            Queues the chapter content for cleaning in the process pool, which writes it to file_path.
+        find_next_chapter_link(self, page_tree) -> str:
+            Finds the URL of the next chapter in the given parsed page.
+        get_declared_charset(self, response: requests.Response) -> str:
+            Returns the charset declared in the response's Content-Type header, if any.
+        get_html_parser(self, encoding: str) -> HTMLParser:
+            Returns a cached lxml parser for the given encoding.
+        parse_webpage(self, webpage_in_html: Union[bytes, IO[bytes]], encoding: str = None) -> Tuple[str, Union[str, HtmlElement]]:
+            Parses a webpage and returns the URL of the next chapter and the chapter content.
         get_last_chapter_scraped(self) -> int:
             Retrieves the number of the last chapter that was scraped.
+        add_chapter(self, webpage_no: int, content, clean: bool = True) -> None:
+            Writes a chapter to the staging directory, cleaning it first unless clean is False.
         scrape_one_webpage(self, web_url: str, webpage_no: int, retry_no: int = 1) -> Tuple[bool, str]:
             Scrapes a single webpage and returns the success status and the URL of the next chapter.
+        fetch_webpage_async(self, session: aiohttp.ClientSession, web_url: str) -> Optional[Tuple[bytes, str]]:
+            Fetches a single webpage asynchronously and returns its body and declared charset.
         get_choice(self, chapterNumber: int) -> str:
             Prompts the user for a choice (retry, skip, continue) when a chapter cannot be scraped.
         scrape_worker(self, batch_size: int) -> None:
             Scrapes multiple webpages in a batch.
-        create_epub(self, author_name: str = 'Unknown', description: str = "A Novel") -> None:
+        scrape_worker_async(self, batch_size: int) -> None:
+            Scrapes multiple webpages in a batch, fetching the next chapter while the current one is processed.
+        remove_log_handler(self) -> None:
+            Detaches and closes the log file handler added by this instance.
+        create_epub(self, author_name: str = 'Unknown', description: str = "A Novel", use_async: bool = True) -> None:
             Creates an EPUB file for the scraped chapters.
     """
 class NovelScraper:
@@ -67,8 +202,13 @@ class NovelScraper:
     LOG_FORMAT = '%(asctime)s %(levelname)s: %(message)s'
     LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
     EPUB_DIR = "epub"
+    STAGING_DIR = "staging"
+    POOL_SIZE = 16
+    MAX_CLEANER_WORKERS = 4
+    TAIL_CHUNK_SIZE = 4096
+    BACKOFF_FACTOR = 0.5
 
-    def __init__(self: Self, novel_name: str, batch_size: int = None) -> None:
+    def __init__(self: Self, novel_name: str, batch_size: int = None, parser: str = "lxml") -> None:
         dotenv.load_dotenv(override=True)
 
         for var in self.REQUIRED_ENV_VARS:
@@ -87,32 +227,68 @@ class NovelScraper:
             self.EPUB_DIR, self.novel_name.replace(" ", "_"), "Links.txt")
         self.output_file_path: str = os.path.join(
             self.EPUB_DIR, self.novel_name.replace(" ", "_"))
+        self.staging_path: str = os.path.join(
+            self.output_file_path, self.STAGING_DIR)
 
         self.max_retries: int = int(os.getenv(self.REQUIRED_ENV_VARS[4]))
+        self._parser: str = parser
+        self._use_bs4: bool = os.getenv("PARSER") == "bs4"
+        self._next_xpath: etree.XPath = etree.XPath(
+            "string(//a[@id=$bid]/@href)", smart_strings=False)
+        # Match the class as one of possibly several, like bs4's find does.
+        self._charset_re: re.Pattern = re.compile(
+            r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+        self._html_parsers: Dict[str, Optional[lxml_html.HTMLParser]] = {}
+        self._content_xpath: etree.XPath = etree.XPath(
+            "(//div[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $cls, ' '))])[1]")
+        # Spawn rather than fork: the first submit happens while aiohttp may
+        # have a resolver thread running, and forking a threaded process can
+        # deadlock the child.
+        self._pool: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=min(self.MAX_CLEANER_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"))
+        self._folder_re: re.Pattern = re.compile(r"(\d+)-(\d+)$")
+        self._last_chapter: Optional[int] = None
+        self._last_chapter_known: bool = False
+        self._cleaning_futures: List[Future] = []
 
         self.epub_book: EpubBook = EpubBook()
-        self.chapters: List[str] = []
+        self.staged_chapters: List[Tuple[str, str]] = []
         self.user_agent: UserAgent = UserAgent()
         self.start_time: time.time = time.time()
+        self._last_written_url: Optional[str] = None
         self.initial_url: str = self.get_url()
         self.session = requests.Session()
-        self.session.headers.update({'User-Agent': self.user_agent.random})
+        retries = Retry(total=self.max_retries, backoff_factor=self.BACKOFF_FACTOR,
+                        status_forcelist=[429, 500, 502, 503, 504], allowed_methods=['GET'])
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE,
+                              pool_maxsize=self.POOL_SIZE, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
         self.LOG_FILENAME = os.path.join(
             self.output_file_path, self.LOG_FILENAME_TEMPLATE.format(self.novel_name))
 
-        logging.basicConfig(
-            filename=self.LOG_FILENAME,
-            level=self.LOG_LEVEL,
-            format=self.LOG_FORMAT,
-            datefmt=self.LOG_DATEFMT
-        )
+        os.makedirs(self.staging_path, exist_ok=True)
+
+        # A handler of our own, unlike basicConfig, is not silently skipped
+        # when the root logger already has handlers. It is only added if no
+        # handler writes to this log yet, and create_epub removes it again.
+        root_logger = logging.getLogger()
+        root_logger.setLevel(self.LOG_LEVEL)
+        log_path = os.path.abspath(self.LOG_FILENAME)
+        self._log_handler: Optional[logging.FileHandler] = None
+        if not any(isinstance(handler, logging.FileHandler) and handler.baseFilename == log_path
+                   for handler in root_logger.handlers):
+            self._log_handler = logging.FileHandler(log_path)
+            self._log_handler.setFormatter(logging.Formatter(
+                self.LOG_FORMAT, datefmt=self.LOG_DATEFMT))
+            root_logger.addHandler(self._log_handler)
 
         self.batch_size: int = batch_size
         if batch_size is None:
             self.batch_size: int = self.get_int_input("Chapter Batch Size")
 
-        os.makedirs(self.output_file_path, exist_ok=True)
-
     def config_ebook_path(self: Self, initial: int, end: int) -> None:
         self.output_file_path: str = os.path.join(
             self.output_file_path, f"{initial}-{end}")
@@ -129,71 +305,74 @@ class NovelScraper:
     def get_novel_name(self):
         return input("Enter the name of the novel: ").title()
 
+    def read_last_line(self: Self, file_path: str) -> Optional[str]:
+
+        with open(file_path, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            position = file.tell()
+            tail = b''
+            while position > 0:
+                step = min(self.TAIL_CHUNK_SIZE, position)
+                position -= step
+                file.seek(position)
+                tail = file.read(step) + tail
+                # Stop once a newline precedes the last non-empty line.
+                if b'\n' in tail.rstrip():
+                    break
+
+        last_line = tail.rstrip().rsplit(b'\n', 1)[-1].strip()
+        return last_line.decode('utf-8') if last_line else None
+
     def write_to_file(self: Self, value: str) -> None:
 
         complete_path = self.urls_file_path
 
         if value == None:
             return
+        value = str(value)
 
-        try:
-            with open(complete_path, 'r') as file:
-                lines = file.readlines()
-                if lines and lines[-1].strip() == str(value):
-                    return
-        except FileNotFoundError:
-            directory = os.path.dirname(complete_path)
-            os.makedirs(directory, exist_ok=True)
+        if self._last_written_url is None:
+            try:
+                self._last_written_url = self.read_last_line(complete_path)
+            except FileNotFoundError:
+                directory = os.path.dirname(complete_path)
+                os.makedirs(directory, exist_ok=True)
+
+        if value == self._last_written_url:
+            return
 
         with open(complete_path, 'a+') as file:
-            file.write(str(value) + '\n')
+            file.write(value + '\n')
+        self._last_written_url = value
 
     def get_url(self: Self):
 
         try:
-            with open(self.urls_file_path, 'r') as file:
-                lines = file.readlines()
-                lines = [line.strip() for line in lines if line.strip()]
-                if lines:
-                    return lines[-1]
+            last_line = self.read_last_line(self.urls_file_path)
         except FileNotFoundError:
             chapter_url = input("Enter the First URL: ")
             self.write_to_file(value=chapter_url)
             return chapter_url
 
-    # Cleaners
-
-    def remove_pattern(self, data, match_string):
-        return "\n".join(line for line in data.split("\n") if match_string.lower() not in line.lower())
-
-    def remove_exclusions(self, data, exclusions):
-        return re.sub('|'.join(map(re.escape, exclusions)), '', data)
-
-    def remove_last_p_tag(self, data):
-        data = soup(data, 'html.parser')
-        p_tags = data.find_all('p')
-        if p_tags:
-            p_tags[-1].extract()
-        return data
-
-    def clean_text(self, data):
-        data = unicodedata.normalize('NFKC', data)
-        data = self.remove_pattern(data, "libread.com")
-        data = self.remove_exclusions(data, [
-            "Translator:",
-            "Atlas Studios",
-            "Editor:",
-            "EndlessFantasy Translation"
-        ])
-        data = self.remove_last_p_tag(data)
-        return str(data)
+        self._last_written_url = last_line
+        return last_line
+
+    def submit_clean_text(self: Self, data, heading: str, file_path: str) -> Future:
+        # Ship lxml elements as bytes; only the serialized div crosses the
+        # process boundary, and the cleaned text goes straight to disk.
+        if not isinstance(data, str):
+            data = etree.tostring(data, with_tail=False)
+        return self._pool.submit(_clean_text_static, data, heading, file_path)
 
     '''____________________________________________________________'''
 
-    def find_next_chapter_link(self: Self, page_soup):
-        next_button = page_soup.find("a", {"id": self.button_tag})
-        if next_button:
-            next_link = next_button.get("href")
+    def find_next_chapter_link(self: Self, page_tree):
+        if self._use_bs4:
+            next_button = page_tree.find("a", {"id": self.button_tag})
+            next_link = next_button.get("href") if next_button else None
+        else:
+            next_link = self._next_xpath(page_tree, bid=self.button_tag)
+        if next_link:
             if self.domain_name in next_link:
                 return next_link
             else:
@@ -202,20 +381,83 @@ class NovelScraper:
 
     def get_last_chapter_scraped(self: Self):
 
-        if not os.path.isdir(self.output_file_path):
+        if self._last_chapter_known:
+            return self._last_chapter
+
+        # DirEntry.is_dir() comes from the directory read, so this needs no
+        # extra stat per folder.
+        highest_value = -1
+        try:
+            with os.scandir(self.output_file_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    match = self._folder_re.match(entry.name)
+                    if match:
+                        highest_value = max(highest_value, int(match.group(2)))
+        except FileNotFoundError:
             return None
 
-        highest_value = None
-        for folder_name in os.listdir(self.output_file_path):
-            match = re.match(r"(\d+)-(\d+)", folder_name)
-            if match:
-                if os.path.isdir(os.path.join(self.output_file_path, folder_name)):
-                    start, end = map(int, match.groups())
+        highest_value = highest_value if highest_value >= 0 else None
+        self._last_chapter = highest_value
+        self._last_chapter_known = True
+        return highest_value
 
-                    highest_value = end if highest_value is None else max(
-                        highest_value, end)
+    def get_declared_charset(self: Self, response: requests.Response) -> Optional[str]:
+        # requests.Response.encoding falls back to ISO-8859-1 for any text/*
+        # type, so only a charset the header actually names is used.
+        match = self._charset_re.search(response.headers.get('Content-Type', ''))
+        return match.group(1) if match else None
 
-        return highest_value
+    def get_html_parser(self: Self, encoding: Optional[str]) -> Optional[lxml_html.HTMLParser]:
+        if encoding is None:
+            return None
+        if encoding not in self._html_parsers:
+            try:
+                self._html_parsers[encoding] = lxml_html.HTMLParser(encoding=encoding)
+            except LookupError:
+                logging.warning(f"Unknown charset {encoding}, letting lxml detect it")
+                self._html_parsers[encoding] = None
+        return self._html_parsers[encoding]
+
+    def parse_webpage(self: Self, webpage_in_html: Union[bytes, IO[bytes]], encoding: Optional[str] = None) -> Tuple[str, Union[str, lxml_html.HtmlElement]]:
+        if isinstance(webpage_in_html, bytes):
+            webpage_in_html = io.BytesIO(webpage_in_html)
+
+        # Without a declared charset libxml2 falls back to Latin-1 for pages
+        # that have no <meta charset>, so the header's charset is passed on.
+        if self._use_bs4:
+            parsed_html_webpage = soup(
+                webpage_in_html, self._parser, from_encoding=encoding)
+            relevant_html_part = parsed_html_webpage.find(
+                "div", {"class": self.text_tag})
+            if relevant_html_part:
+                relevant_html_part = relevant_html_part.prettify()
+            return self.find_next_chapter_link(parsed_html_webpage), relevant_html_part
+
+        try:
+            tree = lxml_html.parse(
+                webpage_in_html, parser=self.get_html_parser(encoding)).getroot()
+        except (etree.ParserError, etree.XMLSyntaxError):
+            return None, None
+        if tree is None:
+            return None, None
+
+        elems = self._content_xpath(tree, cls=self.text_tag)
+        relevant_html_part = elems[0] if elems else None
+        return self.find_next_chapter_link(tree), relevant_html_part
+
+    def add_chapter(self: Self, webpage_no: int, content, clean: bool = True) -> None:
+        title: str = f"Chapter {webpage_no}"
+        file_name: str = f"chapter{webpage_no}.xhtml"
+        staged_path: str = os.path.join(self.staging_path, file_name)
+        heading: str = f'<h2>{title}</h2>'
+        if clean:
+            self._cleaning_futures.append(
+                self.submit_clean_text(content, heading, staged_path))
+        else:
+            write_chapter_file(staged_path, heading + content)
+        self.staged_chapters.append((title, file_name))
 
     def scrape_one_webpage(self: Self, web_url: str, webpage_no: int, retry_no: int = 1) -> str:
 
@@ -223,43 +465,49 @@ class NovelScraper:
             logging.info(f"No more chapters to scrape. Stopping at chapter {webpage_no}")
             return False, None
 
+        # The session adapter already retries connection errors, 429 and 5xx
+        # responses with backoff, so the user is asked as soon as it gives up
+        # or the server answers with another error status. Pages that load
+        # without chapter content are retried here with an increasing delay,
+        # and the user is only asked every max_retries attempts, as before.
         while True:
-            self.session.headers.update({'User-Agent': self.user_agent.random})
-
+            next_url, relevant_html_part = None, None
+            request_failed = False
             try:
-                req = self.session.get(web_url)
-            except Exception as e:
+                req = self.session.get(web_url, stream=True)
+            except requests.RequestException as e:
                 logging.error(f"Failed to get {web_url}: {e}")
-                continue
-
-            webpage_in_html: str = req.content
-            req.close()
-            parsed_html_webpage: str = soup(webpage_in_html, "html.parser")
-
-            next_url = self.find_next_chapter_link(parsed_html_webpage)
-
-            relevant_html_part: str = parsed_html_webpage.find(
-                "div", {"class": self.text_tag})
-
-            if retry_no > 8 % self.max_retries:
-                logging.info(f'Retrying {web_url} for the {retry_no} time')
-
-            if relevant_html_part:
-                chapter: EpubHtml = EpubHtml(
-                    title=f"Chapter {webpage_no}", file_name=f"chapter{webpage_no}.xhtml", lang='en')
-                chapter.content = f'<h2>Chapter {webpage_no}</h2>{self.clean_text(relevant_html_part.prettify())}'
-                self.epub_book.add_item(chapter)
-                self.chapters.append(chapter)
+                request_failed = True
+            else:
+                # Parse straight from the socket so the body is never copied
+                # into an intermediate bytes object.
+                try:
+                    req.raise_for_status()
+                    req.raw.decode_content = True
+                    next_url, relevant_html_part = self.parse_webpage(
+                        req.raw, self.get_declared_charset(req))
+                except requests.HTTPError as e:
+                    logging.error(f"Failed to get {web_url}: {e}")
+                    request_failed = True
+                except Exception as e:
+                    logging.error(f"Failed to read {web_url}: {e}")
+                finally:
+                    req.close()
+
+            if relevant_html_part is not None:
+                self.add_chapter(webpage_no, relevant_html_part)
                 logging.info(
                     f'Successfully scraped chapter {webpage_no} from URL {web_url} on retry {retry_no}')
                 return True, next_url
 
-            if retry_no % self.max_retries == 0:
+            if not request_failed and retry_no % self.max_retries != 0:
+                time.sleep(min(self.BACKOFF_FACTOR * 2 ** retry_no,
+                               Retry.DEFAULT_BACKOFF_MAX))
+            else:
                 user_choice = self.get_choice(chapterNumber=webpage_no)
                 if user_choice.lower() == 'n':
-                    chapter.content = f'<h2>Chapter {webpage_no}</h2> <p> Chapter not available </p>'
-                    self.epub_book.add_item(chapter)
-                    self.chapters.append(chapter)
+                    self.add_chapter(
+                        webpage_no, CHAPTER_NOT_AVAILABLE, clean=False)
                     logging.warning(
                         f'Unable to scrape chapter {webpage_no}. Continuing.')
                     return True, next_url
@@ -269,6 +517,16 @@ class NovelScraper:
                     logging.info(f'Attempting scrape for new URL: {web_url}')
 
             retry_no += 1
+            logging.info(f'Retrying {web_url} for the {retry_no} time')
+
+    async def fetch_webpage_async(self: Self, session: aiohttp.ClientSession, web_url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        try:
+            async with session.get(web_url) as response:
+                response.raise_for_status()
+                return await response.read(), response.charset
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Failed to get {web_url}: {e}")
+            return None
 
     def get_choice(self: Self,chapterNumber: int) -> str:
         while True:
@@ -280,12 +538,11 @@ class NovelScraper:
                 print("Hush, You wrong doer")
 
     def scrape_worker(self: Self, batch_size: int) -> None:
+        self.session.headers.update({'User-Agent': self.user_agent.random})
         current_url: str = self.initial_url
         last_valid_url: str = current_url
-        if self.get_last_chapter_scraped() is not None:
-            initial_chapter_number: int = self.get_last_chapter_scraped() + 1
-        else:
-            initial_chapter_number: int = 1
+        last_chapter = self.get_last_chapter_scraped()
+        initial_chapter_number: int = (last_chapter + 1) if last_chapter is not None else 1
         for i in range(initial_chapter_number, initial_chapter_number + batch_size):
             has_more_pages, current_url = self.scrape_one_webpage(current_url, i)
             if current_url is not None:
@@ -294,27 +551,118 @@ class NovelScraper:
                 break
         self.write_to_file(last_valid_url)
         self.config_ebook_path(initial_chapter_number, i)
+        self._last_chapter_known = False
 
-    def create_epub(self: Self, author_name: str = 'Unknown', description: str = "A Novel") -> None:
-        self.scrape_worker(self.batch_size)
-        self.epub_book.set_title(self.novel_name)
-        self.epub_book.set_language('en')
-        self.epub_book.add_author(author_name)
-        self.epub_book.add_metadata('DC', 'description', description)
-
-        # Create the TOC
-        self.epub_book.toc = [Section("Scraped Text")]
-        for chapter in self.chapters:
-            self.epub_book.toc.append(Link(chapter.file_name, chapter.title, chapter.id))
-
-        self.epub_book.spine = ['nav'] + self.chapters
-        self.epub_book.add_item(EpubNcx())
-        self.epub_book.add_item(EpubNav())
-
-        if not os.path.exists(self.output_file_path):
-            os.makedirs(self.output_file_path)
-
-        final_path: str = os.path.join(
-            self.output_file_path, f"{self.novel_name} {self.batch_size}.epub")
-        print(f"Final Path: {final_path}")
-        write_epub(final_path, self.epub_book, {})
\ No newline at end of file
+    async def scrape_worker_async(self: Self, batch_size: int) -> None:
+        self.session.headers.update({'User-Agent': self.user_agent.random})
+        current_url: str = self.initial_url
+        last_valid_url: str = current_url
+        last_chapter = self.get_last_chapter_scraped()
+        initial_chapter_number: int = (last_chapter + 1) if last_chapter is not None else 1
+
+        last_chapter_number: int = initial_chapter_number + batch_size - 1
+
+        # Only the User-Agent is shared with the requests session; aiohttp sets
+        # its own Accept-Encoding and connection headers for what it can decode.
+        connector = aiohttp.TCPConnector(limit=8)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            pending = None
+            if current_url is not None:
+                pending = asyncio.create_task(
+                    self.fetch_webpage_async(session, current_url))
+
+            for i in range(initial_chapter_number, initial_chapter_number + batch_size):
+                next_url, relevant_html_part = None, None
+                if pending is not None:
+                    fetched = await pending
+                    pending = None
+                    if fetched is not None and fetched[0]:
+                        next_url, relevant_html_part = self.parse_webpage(*fetched)
+
+                if relevant_html_part is not None:
+                    # Request the next chapter before cleaning this one so the
+                    # download overlaps with the CPU work below.
+                    if next_url is not None and i < last_chapter_number:
+                        pending = asyncio.create_task(
+                            self.fetch_webpage_async(session, next_url))
+                        await asyncio.sleep(0)
+                    self.add_chapter(i, relevant_html_part)
+                    logging.info(
+                        f'Successfully scraped chapter {i} from URL {current_url} on retry 1')
+                    has_more_pages = True
+                else:
+                    # Fall back to the blocking retry loop, which also handles
+                    # the end of the novel and prompting the user.
+                    has_more_pages, next_url = self.scrape_one_webpage(
+                        current_url, i, retry_no=2)
+                    if has_more_pages and next_url is not None and i < last_chapter_number:
+                        pending = asyncio.create_task(
+                            self.fetch_webpage_async(session, next_url))
+
+                current_url = next_url
+                if current_url is not None:
+                    last_valid_url = current_url
+                if not has_more_pages:
+                    break
+
+            if pending is not None:
+                pending.cancel()
+
+        self.write_to_file(last_valid_url)
+        self.config_ebook_path(initial_chapter_number, i)
+        self._last_chapter_known = False
+
+    def remove_log_handler(self: Self) -> None:
+        if self._log_handler is not None:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_handler.close()
+            self._log_handler = None
+
+    def create_epub(self: Self, author_name: str = 'Unknown', description: str = "A Novel", use_async: bool = True) -> None:
+        try:
+            if use_async:
+                asyncio.run(self.scrape_worker_async(self.batch_size))
+            else:
+                self.scrape_worker(self.batch_size)
+            self.epub_book.set_title(self.novel_name)
+            self.epub_book.set_language('en')
+            self.epub_book.add_author(author_name)
+            self.epub_book.add_metadata('DC', 'description', description)
+
+            # Every staged file must be written before the book reads it
+            for future in self._cleaning_futures:
+                error = future.result()
+                if error is not None:
+                    logging.error(error)
+            self._cleaning_futures.clear()
+
+            # Create the TOC
+            self.epub_book.toc = [Section("Scraped Text")]
+            chapters: List[StagedEpubHtml] = []
+            for title, file_name in self.staged_chapters:
+                chapter: StagedEpubHtml = StagedEpubHtml(
+                    os.path.join(self.staging_path, file_name), title=title, file_name=file_name, lang='en')
+                self.epub_book.add_item(chapter)
+                chapters.append(chapter)
+                self.epub_book.toc.append(Link(chapter.file_name, chapter.title, chapter.id))
+
+            self.epub_book.spine = ['nav'] + chapters
+            self.epub_book.add_item(EpubNcx())
+            self.epub_book.add_item(EpubNav())
+
+            os.makedirs(self.output_file_path, exist_ok=True)
+
+            final_path: str = os.path.join(
+                self.output_file_path, f"{self.novel_name} {self.batch_size}.epub")
+            print(f"Final Path: {final_path}")
+            write_epub(final_path, self.epub_book, {})
+
+            for chapter in chapters:
+                os.remove(chapter.staged_path)
+            self.staged_chapters.clear()
+        finally:
+            # Also runs when scraping or cleaning fails, so the worker
+            # processes never outlive the batch.
+            self._pool.shutdown(cancel_futures=True)
+            self.remove_log_handler()